@@ -52,6 +52,10 @@ class Data(abc.ABC):
     ) -> None:
         super().__init_subclass__(**kwargs)
         if not conf_name:
+            # When adding slots, attrs recreates the class with a copy of the original
+            # namespace, calling this again without our arguments. Keep the existing info.
+            if '_Data__info' in vars(cls):
+                return
             raise ValueError('Config name must be specified!')
         if conf_name.casefold() in {'version', 'name'}:
             raise ValueError(f'Illegal name: "{conf_name}"')
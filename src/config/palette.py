@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from uuid import UUID
+import functools
 
 import attrs
 from srctools import Property, bool_as_int
@@ -11,8 +12,23 @@ from BEE2_config import GEN_OPTS as LEGACY_CONF
 import config
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_uuid_hex(value: str) -> UUID:
+    """Parse a UUID from its hex form.
+
+    The same UUIDs are parsed each time the config is reloaded, so cache them.
+    """
+    return UUID(hex=value)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_uuid_bytes(value: bytes) -> UUID:
+    """Parse a UUID from its binary form, reusing the result for repeated values."""
+    return UUID(bytes=value)
+
+
 @config.APP.register
-@attrs.frozen(slots=False)
+@attrs.frozen
 class PaletteState(config.Data, conf_name='Palette', palette_stores=False):
     """Data related to palettes which is restored next run.
 
@@ -21,13 +37,20 @@ class PaletteState(config.Data, conf_name='Palette', palette_stores=False):
     selected: UUID = UUID_PORTAL2
     save_settings: bool = False
     hidden_defaults: frozenset[UUID] = attrs.Factory(frozenset)
+    # Precomputed for exporting, since this is frozen.
+    _selected_bytes: bytes = attrs.field(init=False, repr=False, eq=False)
+
+    @_selected_bytes.default
+    def _compute_selected_bytes(self) -> bytes:
+        """Compute the bytes of the selected UUID."""
+        return self.selected.bytes
 
     @classmethod
     def parse_legacy(cls, conf: Property) -> dict[str, PaletteState]:
         """Convert the legacy config options to the new format."""
         # These are all in the GEN_OPTS config.
         try:
-            selected_uuid = UUID(hex=LEGACY_CONF.get_val('Last_Selected', 'palette_uuid', ''))
+            selected_uuid = _parse_uuid_hex(LEGACY_CONF.get_val('Last_Selected', 'palette_uuid', ''))
         except ValueError:
             selected_uuid = UUID_PORTAL2
 
@@ -41,55 +64,58 @@ class PaletteState(config.Data, conf_name='Palette', palette_stores=False):
     def parse_kv1(cls, data: Property, version: int) -> PaletteState:
         """Parse Keyvalues data."""
         assert version == 1
-        hidden = {
-            UUID(hex=prop.value)
-            for prop in data.find_all('hidden')
-        }
         try:
-            uuid = UUID(hex=data['selected'])
+            uuid = _parse_uuid_hex(data['selected'])
         except (LookupError, ValueError):
             uuid = UUID_PORTAL2
-        hidden.discard(uuid)
-        hidden -= FORCE_SHOWN
-        return PaletteState(uuid, data.bool('save_settings', False), frozenset(hidden))
+        # Skip the selected and force-shown palettes while parsing, instead of removing after.
+        hidden = frozenset(
+            hidden_uuid
+            for prop in data.find_all('hidden')
+            if (hidden_uuid := _parse_uuid_hex(prop.value)) != uuid
+            and hidden_uuid not in FORCE_SHOWN
+        )
+        return PaletteState(uuid, data.bool('save_settings', False), hidden)
 
     def export_kv1(self) -> Property:
         """Export to a property block."""
         prop = Property('', [
-            Property('selected', self.selected.hex),
+            Property('selected', self._selected_bytes.hex()),
             Property('save_settings', bool_as_int(self.save_settings)),
         ])
         for hidden in self.hidden_defaults:
-            prop.append(Property('hidden', hidden.hex))
+            prop.append(Property('hidden', hidden.bytes.hex()))
         return prop
 
     @classmethod
     def parse_dmx(cls, data: Element, version: int) -> PaletteState:
         """Parse DMX data."""
         try:
-            uuid = UUID(bytes=data['selected'].val_bytes)
+            uuid = _parse_uuid_bytes(data['selected'].val_bytes)
         except (LookupError, ValueError):
             uuid = UUID_PORTAL2
-        hidden: set[UUID]
+        hidden: frozenset[UUID]
         try:
             hidden_arr = data['hidden'].iter_bytes()
         except KeyError:
-            hidden = set()
+            hidden = frozenset()
         else:
-            hidden = {UUID(bytes=byt) for byt in hidden_arr}
-            hidden.discard(uuid)
-            hidden -= FORCE_SHOWN
+            hidden = frozenset(
+                hidden_uuid
+                for hidden_uuid in map(_parse_uuid_bytes, hidden_arr)
+                if hidden_uuid != uuid and hidden_uuid not in FORCE_SHOWN
+            )
 
         return PaletteState(
             uuid,
             data['save_settings'].val_bool,
-            frozenset(hidden),
+            hidden,
         )
 
     def export_dmx(self) -> Element:
         """Export to a DMX."""
         elem = Element('Palette', 'DMElement')
-        elem['selected'] = self.selected.bytes
+        elem['selected'] = self._selected_bytes
         elem['save_settings'] = self.save_settings
         elem['hidden'] = hidden = DMAttribute.array('hidden', ValueType.BINARY)
         for uuid in self.hidden_defaults:
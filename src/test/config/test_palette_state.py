@@ -40,6 +40,7 @@ def test_parse_kv1(save: int) -> None:
         Keyvalues('hidden', another_uuid.hex),
         Keyvalues('hidden', UUID_EXPORT.hex),
         Keyvalues('hidden', UUID_PORTAL2.hex),
+        Keyvalues('hidden', some_uuid.hex),
         Keyvalues('save_settings', str(save)),
     ])
     state = PaletteState.parse_kv1(kv, 1)
@@ -50,6 +51,8 @@ def test_parse_kv1(save: int) -> None:
     assert another_uuid in state.hidden_defaults
     assert UUID_EXPORT in state.hidden_defaults
     assert UUID_PORTAL2 not in state.hidden_defaults
+    # The selected palette can't be hidden.
+    assert some_uuid not in state.hidden_defaults
 
 
 @pytest.mark.parametrize('save', [0, 1])
@@ -88,6 +91,7 @@ def test_parse_dmx(save: bool) -> None:
         another_uuid.bytes,
         UUID_EXPORT.bytes,
         UUID_PORTAL2.bytes,
+        some_uuid.bytes,
     ]
     state = PaletteState.parse_dmx(elem, 1)
 
@@ -97,6 +101,8 @@ def test_parse_dmx(save: bool) -> None:
     assert another_uuid in state.hidden_defaults
     assert UUID_EXPORT in state.hidden_defaults
     assert UUID_PORTAL2 not in state.hidden_defaults
+    # The selected palette can't be hidden.
+    assert some_uuid not in state.hidden_defaults
 
 
 @pytest.mark.parametrize('save', [False, True])
@@ -118,3 +124,25 @@ def test_export_dmx(save: bool) -> None:
     assert elem['save_settings'].val_bool is save
     hiddens = set(elem['hidden'].iter_binary())
     assert hiddens == {another_uuid.bytes, UUID_EXPORT.bytes}
+
+
+def test_parse_kv1_uuid_formats() -> None:
+    """Test hyphenated/braced UUIDs are accepted, and invalid selections use the default."""
+    some_uuid = uuid.uuid4()
+    another_uuid = uuid.uuid4()
+    kv = Keyvalues('Palette', [
+        Keyvalues('selected', 'not_a_uuid'),
+        Keyvalues('hidden', str(some_uuid)),
+        Keyvalues('hidden', f'{{{another_uuid}}}'),
+        Keyvalues('save_settings', '0'),
+    ])
+    state = PaletteState.parse_kv1(kv, 1)
+
+    assert state.selected == UUID_PORTAL2
+    assert state.hidden_defaults == {some_uuid, another_uuid}
+
+
+def test_slotted() -> None:
+    """Test the slotted class keeps its config registration."""
+    assert not hasattr(PaletteState(), '__dict__')
+    assert PaletteState.get_conf_info().name == 'Palette'
@@ -2,7 +2,10 @@
 
 UserError is imported all over, so this needs to have minimal imports to avoid cycles.
 """
-from typing import ClassVar, Collection, Dict, Iterable, List, Literal, Optional, Tuple, TypedDict
+from typing import (
+    ClassVar, Collection, Dict, Iterable, List, Literal, Optional, Sequence, Tuple,
+    TypedDict,
+)
 from pathlib import Path
 
 from srctools import Vec, logger
@@ -39,11 +42,11 @@ class ErrorInfo:
     context: str = ''
     faces: Dict[Kind, List[SimpleTile]] = attrs.Factory(dict)
     # Voxels of interest in the map.
-    voxels: List[Tuple[float, float, float]] = attrs.Factory(list)
+    voxels: Sequence[Tuple[float, float, float]] = ()
     # Points of interest in the map.
-    points: List[Tuple[float, float, float]] = attrs.Factory(list)
+    points: Sequence[Tuple[float, float, float]] = ()
     # Special list of locations forming a pointfile line.
-    leakpoints: List[Tuple[float, float, float]] = attrs.Factory(list)
+    leakpoints: Sequence[Tuple[float, float, float]] = ()
     # If a glass/grating hole is misplaced, show its location.
     barrier_hole: Optional[BarrierHole] = None
 
@@ -68,6 +71,28 @@ def to_threespace(vec: Vec) -> Tuple[float, float, float]:
     )
 
 
+def _batch_threespace(vecs: Iterable[Vec]) -> List[Tuple[float, float, float]]:
+    """Convert many vectors at once, avoiding a function call per vector.
+
+    1/128 is exactly representable, so multiplying gives identical results to to_threespace().
+    """
+    scale = 1.0 / 128.0
+    return [(vec.x * scale, vec.z * scale, vec.y * -scale) for vec in vecs]
+
+
+def _build_message(message: TransToken, docsurl: str, textlist: Collection[str]) -> TransToken:
+    """Add the bullet list and documentation link to a message."""
+    if textlist:
+        # Build up a bullet list.
+        message = TOK_LIST.format(
+            msg=message,
+            list=TOK_LIST_SEP.join([TOK_LIST_ELEM.format(text=value) for value in textlist]),
+        )
+    if docsurl:
+        message = TOK_SEEDOCS.format(msg=message, url=docsurl)
+    return message
+
+
 class UserError(BaseException):
     """Special exception used to indicate a error in item placement, etc.
 
@@ -113,28 +138,16 @@ class UserError(BaseException):
         if leakpoints:
             textlist = [f'({point})' for point in leakpoints]
 
-        if textlist:
-            # Build up a bullet list.
-            tok_list_elem = TransToken.untranslated('<li><code>{text}</code></li>')
-            message = TransToken.untranslated('{msg}\n<ul>{list}</ul>').format(
-                msg=message,
-                list=TransToken.untranslated('\n').join([
-                    tok_list_elem.format(text=value)
-                    for value in textlist
-                ]),
-            )
-
-        if docsurl:
-            message = TOK_SEEDOCS.format(msg=message, url=docsurl)
+        message = _build_message(message, docsurl, textlist)
 
         self.info = ErrorInfo(
             message=message,
             language_file=None,
             context=ctx,
             faces=self._simple_tiles,
-            voxels=list(map(to_threespace, voxels)),
-            points=list(map(to_threespace, points)),
-            leakpoints=list(map(to_threespace, leakpoints)),
+            voxels=_batch_threespace(voxels),
+            points=_batch_threespace(points),
+            leakpoints=_batch_threespace(leakpoints),
             barrier_hole=barrier_hole,
         )
 
@@ -167,6 +180,11 @@ TOK_WRONG_ITEM_TYPE = TransToken.ui(
     'The item "<var>{item}</var>" is not a {kind}!<br>Instance: <code>{inst}</code>'
 )
 
+# Used to build up the bullet list for textlist values.
+TOK_LIST = TransToken.untranslated('{msg}\n<ul>{list}</ul>')
+TOK_LIST_ELEM = TransToken.untranslated('<li><code>{text}</code></li>')
+TOK_LIST_SEP = TransToken.untranslated('\n')
+
 TOK_SEEDOCS = TransToken.untranslated('{msg}\n<p><a href="{url}">{docs}</a>.</p>').format(
     docs=TransToken.ui('See the documentation')
 )